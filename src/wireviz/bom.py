@@ -25,8 +25,7 @@ BOMEntry = dict[BOMColumn, str | int | float | list[str] | None]
 
 def optional_fields(part: Connector | Cable | AdditionalComponent) -> BOMEntry:
     """Return part field values for the optional BOM columns as a dict."""
-    part = asdict(part)
-    return {field: part.get(field) for field in BOM_COLUMNS_OPTIONAL}
+    return {field: getattr(part, field, None) for field in BOM_COLUMNS_OPTIONAL}
 
 
 def evaluate_additional_component_qty(
@@ -49,8 +48,8 @@ def evaluate_additional_component_qty(
         context.update(
             {
                 "pincount": component.pincount,
-                "populated": sum(component.visible_pins.values()),
-                "unpopulated": max(0, component.pincount - sum(component.visible_pins.values())),
+                "populated": len(component.visible_pins),
+                "unpopulated": max(0, component.pincount - len(component.visible_pins)),
             }
         )
     elif isinstance(component, Cable):
@@ -167,8 +166,8 @@ def evaluate_additional_bom_item_qty(item: BOMEntry, harness: "Harness") -> floa
             # Create a namespace for this connector
             context[name] = {
                 "pincount": conn.pincount,
-                "populated": sum(conn.visible_pins.values()),
-                "unpopulated": max(0, conn.pincount - sum(conn.visible_pins.values())),
+                "populated": len(conn.visible_pins),
+                "unpopulated": max(0, conn.pincount - len(conn.visible_pins)),
             }
         elif name in harness.cables:
             cable = harness.cables[name]
@@ -193,8 +192,8 @@ def evaluate_additional_bom_item_qty(item: BOMEntry, harness: "Harness") -> floa
         if name in harness.connectors:
             conn = harness.connectors[name]
             total_pincount += conn.pincount
-            total_populated += sum(conn.visible_pins.values())
-            total_unpopulated += max(0, conn.pincount - sum(conn.visible_pins.values()))
+            total_populated += len(conn.visible_pins)
+            total_unpopulated += max(0, conn.pincount - len(conn.visible_pins))
         elif name in harness.cables:
             cable = harness.cables[name]
             total_wirecount += cable.wirecount
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 
+import functools
+import itertools
 import os
+import re
+import shlex
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 import typer
 
 from wireviz import APP_NAME, __version__, wireviz
-from wireviz.helper import open_file_append, open_file_read, open_file_write
+from wireviz.helper import file_read_text, open_file_write
 
 script_path = Path(__file__).absolute()
 
@@ -35,31 +43,120 @@ groups = {
     },
 }
 
-input_extensions = [".yml"]
-extensions_not_containing_graphviz_output = [".gv", ".bom.tsv"]
-extensions_containing_graphviz_output = [".png", ".svg", ".html"]
+
+class GroupInfo(NamedTuple):
+    """Pre-resolved settings of a file group.
+
+    Attributes:
+        path: Directory containing the files of the group.
+        prefix: Filename prefix of the input files.
+        build_readme: Whether a readme is generated for the group.
+        include_md: Whether the readme includes the .md file of each input.
+        include_yml: Whether the readme includes the YAML source of each input.
+        title: Title of the readme.
+    """
+
+    path: Path
+    prefix: str
+    build_readme: bool
+    include_md: bool
+    include_yml: bool
+    title: str
+
+
+group_info = {
+    key: GroupInfo(
+        path=group["path"],
+        prefix=group["prefix"],
+        build_readme=readme in group,
+        include_md="md" in group.get(readme, []),
+        include_yml="yml" in group.get(readme, []),
+        title=group.get("title", ""),
+    )
+    for key, group in groups.items()
+}
+
+
+input_extensions = (".yml",)
+extensions_not_containing_graphviz_output = (".gv", ".bom.tsv")
+extensions_containing_graphviz_output = (".png", ".svg", ".html")
 generated_extensions = (
     extensions_not_containing_graphviz_output + extensions_containing_graphviz_output
 )
+digits_pattern = re.compile(r"\d+")
+git_executable = shutil.which("git") or "git"  # resolved once instead of per call
+git_batch_size = 500  # max. number of paths per git call, to stay well below ARG_MAX
+
+
+@functools.cache
+def _list_directory(path: Path) -> tuple[str, ...]:
+    """List the names of the regular files in a directory once and cache them.
 
+    Groups sharing a directory (e.g. examples and demos) reuse the same listing.
+    Actions that create or delete files clear the cache when they are done.
+
+    Args:
+        path: Directory to list.
+
+    Returns:
+        Tuple of the names of all files in the directory.
+    """
+    with os.scandir(path) as entries:
+        return tuple(entry.name for entry in entries if entry.is_file())
+
+
+def _scan_group(groupkey: str, ext_list: tuple[str, ...]) -> tuple[Path, ...]:
+    """Select the files of a group from the cached directory listing.
+
+    Args:
+        groupkey: Key identifying the file group to process.
+        ext_list: Tuple of file extensions to match.
 
-def collect_filenames(description: str, groupkey: str, ext_list: list[str]) -> list[Path]:
+    Returns:
+        Sorted tuple of matching file paths.
+    """
+    group = group_info[groupkey]
+    prefix = group.prefix
+    include_readme = ext_list != input_extensions and group.build_readme
+    return tuple(
+        sorted(
+            group.path / name
+            for name in _list_directory(group.path)
+            if (name.startswith(prefix) and name.endswith(ext_list))
+            or (include_readme and name == readme)
+        )
+    )
+
+
+def collect_filenames(
+    description: str, groupkey: str, ext_list: tuple[str, ...]
+) -> tuple[Path, ...]:
     """Collect filenames matching extensions for a specific group.
 
+    The directory listing is cached per directory, so repeated calls within
+    one process do not rescan it.
+
     Args:
         description: Description of the action (e.g., "Building", "Cleaning").
         groupkey: Key identifying the file group to process.
-        ext_list: List of file extensions to match.
+        ext_list: Tuple of file extensions to match.
 
     Returns:
-        Sorted list of matching file paths.
+        Sorted tuple of matching file paths.
     """
-    path = groups[groupkey]["path"]
-    patterns = [f"{groups[groupkey]['prefix']}*{ext}" for ext in ext_list]
-    if ext_list != input_extensions and readme in groups[groupkey]:
-        patterns.append(readme)
-    print(f'{description} {groupkey} in "{path}"')
-    return sorted([filename for pattern in patterns for filename in path.glob(pattern)])
+    print(f'{description} {groupkey} in "{group_info[groupkey].path}"')
+    return _scan_group(groupkey, tuple(ext_list))
+
+
+def _parse_one(yaml_file: Path) -> None:
+    """Generate all output files for a single YAML input file.
+
+    Defined at module level so it can be pickled for the process pool.
+
+    Args:
+        yaml_file: Path to the YAML input file.
+    """
+    wireviz.parse(yaml_file, output_formats=("gv", "html", "png", "svg", "tsv"))
 
 
 def build_generated(groupkeys: list[str]) -> None:
@@ -69,43 +166,47 @@ def build_generated(groupkeys: list[str]) -> None:
         groupkeys: List of group keys to process.
     """
     for key in groupkeys:
-        # preparation
-        path = groups[key]["path"]
-        build_readme = readme in groups[key]
-        if build_readme:
-            include_readme = "md" in groups[key][readme]
-            include_source = "yml" in groups[key][readme]
-            with open_file_write(path / readme) as out:
-                out.write(f"# {groups[key]['title']}\n\n")
-        # collect and iterate input YAML files
-        for yaml_file in collect_filenames("Building", key, input_extensions):
+        # parse input YAML files in parallel
+        yaml_files = collect_filenames("Building", key, input_extensions)
+        for yaml_file in yaml_files:
             print(f'  "{yaml_file}"')
-            wireviz.parse(yaml_file, output_formats=("gv", "html", "png", "svg", "tsv"))
-
-            if build_readme:
-                i = "".join(filter(str.isdigit, yaml_file.stem))
-
-                with open_file_append(path / readme) as out:
-                    if include_readme:
-                        with open_file_read(yaml_file.with_suffix(".md")) as info:
-                            for line in info:
-                                out.write(line.replace("## ", f"## {i} - "))
-                            out.write("\n\n")
-                    else:
-                        out.write(f"## Example {i}\n")
-
-                    if include_source:
-                        with open_file_read(yaml_file) as src:
-                            out.write("```yaml\n")
-                            for line in src:
-                                out.write(line)
-                            out.write("```\n")
-                        out.write("\n")
-
-                    out.write(f"![]({yaml_file.stem}.png)\n\n")
-                    out.write(
-                        f"[Source]({yaml_file.name}) - [Bill of Materials]({yaml_file.stem}.bom.tsv)\n\n\n"
-                    )
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(_parse_one, yaml_files))
+
+        group = group_info[key]
+        if not group.build_readme:
+            continue
+        # compose the readme serially through one handle to keep a deterministic order
+        with open_file_write(group.path / readme) as out:
+            out.write(f"# {group.title}\n\n")
+            for yaml_file in yaml_files:
+                i = "".join(digits_pattern.findall(yaml_file.stem))
+
+                if group.include_md:
+                    info = file_read_text(yaml_file.with_suffix(".md"))
+                    out.write(info.replace("## ", f"## {i} - ") + "\n\n")
+                else:
+                    out.write(f"## Example {i}\n")
+
+                if group.include_yml:
+                    out.write(f"```yaml\n{file_read_text(yaml_file)}```\n\n")
+
+                out.write(f"![]({yaml_file.stem}.png)\n\n")
+                out.write(
+                    f"[Source]({yaml_file.name}) - [Bill of Materials]({yaml_file.stem}.bom.tsv)\n\n\n"
+                )
+    _list_directory.cache_clear()  # the listings predate the generated files
+
+
+def _remove_file(filename: Path) -> bool:
+    """Remove a file, returning False if it no longer exists or is not a file."""
+    if not filename.is_file():
+        return False
+    try:
+        filename.unlink()
+    except FileNotFoundError:
+        return False
+    return True
 
 
 def clean_generated(groupkeys: list[str]) -> None:
@@ -115,11 +216,35 @@ def clean_generated(groupkeys: list[str]) -> None:
         groupkeys: List of group keys to clean.
     """
     for key in groupkeys:
-        # collect and remove files
-        for filename in collect_filenames("Cleaning", key, generated_extensions):
-            if filename.is_file():
+        # remove files, keeping several unlink calls in flight
+        filename_list = collect_filenames("Cleaning", key, generated_extensions)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            removed = list(executor.map(_remove_file, filename_list))
+        for filename, was_removed in zip(filename_list, removed, strict=True):
+            if was_removed:
                 print(f'  rm "{filename}"')
-                Path(filename).unlink()
+    _list_directory.cache_clear()  # the listings still contain the removed files
+
+
+def run_git(args: list[str], filenames: list[Path]) -> bool:
+    """Run a git command on many files using as few git calls as possible.
+
+    Args:
+        args: Git arguments to put before the "--" separating the file names.
+        filenames: Files to pass to git.
+
+    Returns:
+        True if all git calls succeeded.
+    """
+    success = True
+    filenames = iter(filenames)
+    while batch := [str(filename) for filename in itertools.islice(filenames, git_batch_size)]:
+        print(f"  {shlex.join(['git', *args, '--'])}")
+        for filename in batch:
+            print(f'    "{filename}"')
+        cmd = [git_executable, *args, "--", *batch]
+        success = subprocess.run(cmd, shell=False, check=False).returncode == 0 and success
+    return success
 
 
 def compare_generated(
@@ -132,8 +257,7 @@ def compare_generated(
         branch: Git branch or commit to compare against. Empty string for staged changes.
         include_graphviz_output: Whether to include Graphviz output files (PNG, SVG, HTML) in comparison.
     """
-    if branch:
-        branch = f" {branch.strip()}"
+    branch_args = [branch.strip()] if branch else []
     compare_extensions = (
         generated_extensions
         if include_graphviz_output
@@ -141,10 +265,8 @@ def compare_generated(
     )
     for key in groupkeys:
         # collect and compare files
-        for filename in collect_filenames("Comparing", key, compare_extensions):
-            cmd = f'git --no-pager diff{branch} -- "{filename}"'
-            print(f"  {cmd}")
-            os.system(cmd)
+        filename_list = collect_filenames("Comparing", key, compare_extensions)
+        run_git(["--no-pager", "diff", *branch_args], filename_list)
 
 
 def restore_generated(groupkeys: list[str], branch: str = "") -> None:
@@ -154,22 +276,25 @@ def restore_generated(groupkeys: list[str], branch: str = "") -> None:
         groupkeys: List of group keys to restore.
         branch: Git branch or commit to restore from. Empty string for HEAD.
     """
-    if branch:
-        branch = f" {branch.strip()}"
+    branch_args = [branch.strip()] if branch else []
     for key in groupkeys:
-        # collect input YAML files
-        filename_list = collect_filenames("Restoring", key, input_extensions)
         # collect files to restore
+        yaml_files = collect_filenames("Restoring", key, input_extensions)
         filename_list = [
-            fn.with_suffix(ext) for fn in filename_list for ext in generated_extensions
+            Path(stem + ext)
+            for stem in [str(fn.with_suffix("")) for fn in yaml_files]
+            for ext in generated_extensions
         ]
-        if readme in groups[key]:
-            filename_list.append(groups[key]["path"] / readme)
+        group = group_info[key]
+        if group.build_readme:
+            filename_list.append(group.path / readme)
         # restore files
-        for filename in filename_list:
-            cmd = f'git checkout{branch} -- "{filename}"'
-            print(f"  {cmd}")
-            os.system(cmd)
+        if not run_git(["checkout", *branch_args], filename_list):
+            # git refuses the whole call if any file is unknown; restore the others one by one
+            print("  Retrying file by file")
+            for filename in filename_list:
+                run_git(["checkout", *branch_args], [filename])
+    _list_directory.cache_clear()  # restored files may not have been listed
 
 
 def version_callback(value: bool):
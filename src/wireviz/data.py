@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from enum import Enum
+from functools import lru_cache
+from itertools import cycle, islice
+from typing import Any
 
 from wireviz.colors import COLOR_CODES, Color, ColorMode, Colors, ColorScheme
-from wireviz.helper import aspect_ratio, int2tuple
+from wireviz.helper import aspect_ratio
 
 # Each type alias have their legal values described in comments - validation might be implemented in the future
 PlainText = str  # Text not containing HTML tags nor newlines
@@ -32,7 +34,16 @@ OneOrMoreWires = Wire | tuple[Wire, ...]  # One or a tuple of wires
 MetadataKeys = PlainText  # Literal['title', 'description', 'notes', ...]
 
 
-Side = Enum("Side", "LEFT RIGHT")
+class Side:
+    """Side of a connector where a pin is connected.
+
+    Plain int constants instead of an Enum keep the comparisons in
+    Connector.activate_pin() cheap.
+    """
+
+    __slots__ = ()
+    LEFT = 1
+    RIGHT = 2
 
 
 class Metadata(dict):
@@ -45,7 +56,37 @@ class Metadata(dict):
     pass
 
 
-@dataclass
+def _typed_mapping(mapping: dict[str, Any]) -> dict[str, Any]:
+    """Copy a connector/cable mapping with nested image and component dicts converted."""
+    mapping = dict(mapping)
+    if isinstance(mapping.get("image"), dict):
+        mapping["image"] = Image(**mapping["image"])
+    if "additional_components" in mapping:
+        mapping["additional_components"] = [
+            AdditionalComponent(**item) if isinstance(item, dict) else item
+            for item in mapping["additional_components"]
+        ]
+    return mapping
+
+
+@lru_cache(maxsize=128)
+def _expand_palette(colors: tuple[Colors, ...], wirecount: int) -> tuple[Colors, ...]:
+    """Loop or cut a color palette to exactly wirecount entries.
+
+    Cables using the same color code share the cached result.
+    """
+    return tuple(islice(cycle(colors), wirecount))
+
+
+def _split_value_unit(raw: str) -> tuple[str, str] | None:
+    """Split a "<value> <unit>" string at its single space, or return None if malformed."""
+    value, sep, unit = raw.partition(" ")
+    if not sep or " " in unit:
+        return None
+    return value, unit
+
+
+@dataclass(slots=True)
 class Options:
     """Configuration options for harness diagram generation.
 
@@ -95,7 +136,7 @@ class Tweak:
     append: str | list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     """Image configuration for connectors and cables.
 
@@ -148,7 +189,7 @@ class Image:
                     self.height = self.width / aspect_ratio(self.src)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdditionalComponent:
     """Additional component to be included in BOM.
 
@@ -186,7 +227,7 @@ class AdditionalComponent:
         return t
 
 
-@dataclass
+@dataclass(slots=True)
 class Connector:
     """Connector component in a harness.
 
@@ -243,37 +284,43 @@ class Connector:
     loops: list[list[Pin]] = field(default_factory=list)
     ignore_in_bom: bool = False
     additional_components: list[AdditionalComponent] = field(default_factory=list)
+    # Runtime state, declared as fields so that they get a slot
+    ports_left: bool = field(default=False, init=False, repr=False, compare=False)
+    ports_right: bool = field(default=False, init=False, repr=False, compare=False)
+    visible_pins: set[Pin] = field(default_factory=set, init=False, repr=False, compare=False)
 
-    def __post_init__(self) -> None:
-        if isinstance(self.image, dict):
-            self.image = Image(**self.image)
+    @classmethod
+    def from_mapping(cls, mapping: dict[str, Any]) -> "Connector":
+        """Construct an instance from a dict parsed from YAML, typing nested dicts first.
 
-        self.ports_left = False
-        self.ports_right = False
-        self.visible_pins = {}
+        Direct construction expects image and additional_components to be
+        Image and AdditionalComponent instances already.
+        """
+        return cls(**_typed_mapping(mapping))
 
+    def __post_init__(self) -> None:
         if self.style == "simple":
             if self.pincount and self.pincount > 1:
                 raise Exception("Connectors with style set to simple may only have one pin")
             self.pincount = 1
 
         if not self.pincount:
-            self.pincount = max(len(self.pins), len(self.pinlabels), len(self.pincolors))
+            pc, pl, pk = len(self.pins), len(self.pinlabels), len(self.pincolors)
+            self.pincount = pc if pc >= pl and pc >= pk else (pl if pl >= pk else pk)
             if not self.pincount:
                 raise Exception(
                     "You need to specify at least one, pincount, pins, pinlabels, or pincolors"
                 )
 
-        # create default list for pins (sequential) if not specified
         if not self.pins:
+            # create default list for pins (sequential) if not specified; unique by construction
             self.pins = list(range(1, self.pincount + 1))
-
-        if len(self.pins) != len(set(self.pins)):
+        elif len(set(self.pins)) != len(self.pins):
             raise Exception("Pins are not unique")
 
         if self.show_name is None:
             # hide designators for simple and for auto-generated connectors by default
-            self.show_name = self.style != "simple" and self.name[0:2] != "__"
+            self.show_name = self.style != "simple" and not self.name.startswith("__")
 
         if self.show_pincount is None:
             # hide pincount for simple (1 pin) connectors by default
@@ -290,31 +337,30 @@ class Connector:
                 # Make sure loop connected pins are not hidden.
                 self.activate_pin(pin, None)
 
-        for i, item in enumerate(self.additional_components):
-            if isinstance(item, dict):
-                self.additional_components[i] = AdditionalComponent(**item)
-
-    def activate_pin(self, pin: Pin, side: Side) -> None:
-        self.visible_pins[pin] = True
+    def activate_pin(self, pin: Pin, side: int | None) -> None:
+        self.visible_pins.add(pin)
         if side == Side.LEFT:
             self.ports_left = True
         elif side == Side.RIGHT:
             self.ports_right = True
 
+    # qty_multiplier -> quantity getter, looked up once per additional component
+    _QTY_DISPATCH = {
+        "pincount": lambda c: c.pincount,
+        "populated": lambda c: len(c.visible_pins),
+        "unpopulated": lambda c: max(0, c.pincount - len(c.visible_pins)),
+    }
+
     def get_qty_multiplier(self, qty_multiplier: ConnectorMultiplier | None) -> int:
         if not qty_multiplier:
             return 1
-        elif qty_multiplier == "pincount":
-            return self.pincount
-        elif qty_multiplier == "populated":
-            return sum(self.visible_pins.values())
-        elif qty_multiplier == "unpopulated":
-            return max(0, self.pincount - sum(self.visible_pins.values()))
-        else:
+        getter = self._QTY_DISPATCH.get(qty_multiplier)
+        if getter is None:
             raise ValueError(f"invalid qty multiplier parameter for connector {qty_multiplier}")
+        return getter(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Cable:
     """Cable or wire bundle in a harness.
 
@@ -337,6 +383,7 @@ class Cable:
         color: Overall cable color.
         wirecount: Number of wires in the cable.
         shield: Whether the cable has a shield, or the shield color.
+            Normalized to a bool, with any color moved to shield_color.
         image: Optional image for the cable.
         notes: Additional notes about the cable.
         colors: List of wire colors.
@@ -377,18 +424,33 @@ class Cable:
     show_wirenumbers: bool | None = None
     ignore_in_bom: bool = False
     additional_components: list[AdditionalComponent] = field(default_factory=list)
+    # Runtime state, declared as fields so that they get a slot
+    connections: list["Connection"] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    shield_color: Color | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_mapping(cls, mapping: dict[str, Any]) -> "Cable":
+        """Construct an instance from a dict parsed from YAML, typing nested dicts first.
+
+        Direct construction expects image and additional_components to be
+        Image and AdditionalComponent instances already.
+        """
+        return cls(**_typed_mapping(mapping))
 
     def __post_init__(self) -> None:
-        if isinstance(self.image, dict):
-            self.image = Image(**self.image)
+        if isinstance(self.shield, str):  # shield color specified
+            self.shield_color = self.shield or None
+            self.shield = bool(self.shield)
 
         if isinstance(self.gauge, str):  # gauge and unit specified
-            try:
-                g, u = self.gauge.split(" ")
-            except Exception as e:
+            value_unit = _split_value_unit(self.gauge)
+            if value_unit is None:
                 raise Exception(
                     f"Cable {self.name} gauge={self.gauge} - Gauge must be a number, or number and unit separated by a space"
-                ) from e
+                )
+            g, u = value_unit
             self.gauge = g
 
             if self.gauge_unit is not None:
@@ -407,13 +469,16 @@ class Cable:
             pass  # gauge not specified
 
         if isinstance(self.length, str):  # length and unit specified
+            value_unit = _split_value_unit(self.length)
             try:
-                L, u = self.length.split(" ")
-                L = float(L)
-            except Exception as e:
+                L = float(value_unit[0]) if value_unit else None
+            except ValueError:
+                L = None
+            if L is None:
                 raise Exception(
                     f"Cable {self.name} length={self.length} - Length must be a number, or number and unit separated by a space"
-                ) from e
+                )
+            u = value_unit[1]
             self.length = L
             if self.length_unit is not None:
                 print(
@@ -425,8 +490,6 @@ class Cable:
         elif self.length_unit is None:
             self.length_unit = "m"
 
-        self.connections = []
-
         if self.wirecount:  # number of wires explicitly defined
             if self.colors:  # use custom color palette (partly or looped if needed)
                 pass
@@ -438,12 +501,8 @@ class Cable:
             else:  # no colors defined, add dummy colors
                 self.colors = [""] * self.wirecount
 
-            # make color code loop around if more wires than colors
-            if self.wirecount > len(self.colors):
-                m = self.wirecount // len(self.colors) + 1
-                self.colors = self.colors * int(m)
-            # cut off excess after looping
-            self.colors = self.colors[: self.wirecount]
+            # make color code loop around if more wires than colors, and cut off excess
+            self.colors = list(_expand_palette(tuple(self.colors), self.wirecount))
         else:  # wirecount implicit in length of color list
             if not self.colors:
                 raise Exception(
@@ -456,27 +515,24 @@ class Cable:
                 raise Exception('"s" may not be used as a wire label for a shielded cable.')
 
         # if lists of part numbers are provided check this is a bundle and that it matches the wirecount.
-        for idfield in [self.manufacturer, self.mpn, self.supplier, self.spn, self.pn]:
-            if isinstance(idfield, list):
-                if self.category == "bundle":
-                    # check the length
-                    if len(idfield) != self.wirecount:
-                        raise Exception("lists of part data must match wirecount")
-                else:
+        is_bundle = self.category == "bundle"
+        wirecount = self.wirecount
+        for idfield in (self.manufacturer, self.mpn, self.supplier, self.spn, self.pn):
+            if type(idfield) is list:  # YAML only produces plain lists
+                if not is_bundle:
                     raise Exception("lists of part data are only supported for bundles")
+                # check the length
+                if len(idfield) != wirecount:
+                    raise Exception("lists of part data must match wirecount")
 
         if self.show_name is None:
             # hide designators for auto-generated cables by default
-            self.show_name = self.name[0:2] != "__"
+            self.show_name = not self.name.startswith("__")
 
         if self.show_wirenumbers is None:
             # by default, show wire numbers for cables, hide for bundles
             self.show_wirenumbers = self.category != "bundle"
 
-        for i, item in enumerate(self.additional_components):
-            if isinstance(item, dict):
-                self.additional_components[i] = AdditionalComponent(**item)
-
     # The *_pin arguments accept a tuple, but it seems not in use with the current code.
     def connect(
         self,
@@ -486,32 +542,35 @@ class Cable:
         to_name: Designator | None,
         to_pin: NoneOrMorePinIndices,
     ) -> None:
-        from_pin = int2tuple(from_pin)
-        via_wire = int2tuple(via_wire)
-        to_pin = int2tuple(to_pin)
+        # inlined int2tuple(), as this runs for every connection in the harness
+        from_pin = from_pin if isinstance(from_pin, tuple) else (from_pin,)
+        via_wire = via_wire if isinstance(via_wire, tuple) else (via_wire,)
+        to_pin = to_pin if isinstance(to_pin, tuple) else (to_pin,)
         if len(from_pin) != len(to_pin):
             raise Exception("from_pin must have the same number of elements as to_pin")
-        for i, _ in enumerate(from_pin):
-            self.connections.append(
-                Connection(from_name, from_pin[i], via_wire[i], to_name, to_pin[i])
-            )
+        self.connections.extend(
+            Connection(from_name, fp, vw, to_name, tp)
+            for fp, vw, tp in zip(from_pin, via_wire, to_pin, strict=True)
+        )
+
+    # qty_multiplier -> quantity getter, looked up once per additional component
+    _QTY_DISPATCH = {
+        "wirecount": lambda c: c.wirecount,
+        "terminations": lambda c: len(c.connections),
+        "length": lambda c: c.length,
+        "total_length": lambda c: c.length * c.wirecount,
+    }
 
     def get_qty_multiplier(self, qty_multiplier: CableMultiplier | None) -> float:
         if not qty_multiplier:
             return 1
-        elif qty_multiplier == "wirecount":
-            return self.wirecount
-        elif qty_multiplier == "terminations":
-            return len(self.connections)
-        elif qty_multiplier == "length":
-            return self.length
-        elif qty_multiplier == "total_length":
-            return self.length * self.wirecount
-        else:
+        getter = self._QTY_DISPATCH.get(qty_multiplier)
+        if getter is None:
             raise ValueError(f"invalid qty multiplier parameter for cable {qty_multiplier}")
+        return getter(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Connection:
     """Connection between a pin and a wire.
 
@@ -530,7 +589,7 @@ class Connection:
     to_pin: Pin | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatePin:
     """Direct pin-to-pin mating connection between connectors.
 
@@ -549,7 +608,7 @@ class MatePin:
     shape: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MateComponent:
     """Direct component-to-component mating connection.
 
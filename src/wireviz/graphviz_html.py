@@ -4,9 +4,18 @@ from wireviz.colors import translate_color
 from wireviz.data import Color, Image
 from wireviz.helper import remove_links
 
+# A table cell is either its contents, or a tuple of extra <td> attributes and contents
+Cell = str | tuple[str, str]
+
+_FIXED_WRAP = """
+    <table border="0" cellspacing="0" cellborder="0"><tr>
+     <td{size}>{img}</td>
+    </tr></table>
+   """
+
 
 def nested_html_table(
-    rows: list[str | list[str | None] | None], table_attrs: str = ""
+    rows: list[str | list[Cell | None] | None], table_attrs: str = ""
 ) -> list[str]:
     """Create nested HTML table structure for Graphviz.
 
@@ -15,8 +24,8 @@ def nested_html_table(
 
     Args:
         rows: List of rows, where each row can be a string (scalar) or a list of
-              strings (nested table row). Attributes in leading <tdX> tags are
-              injected into the preceding <td> tag.
+              cells (nested table row). A cell given as an (attributes, contents)
+              tuple gets the attributes added to its <td> tag.
         table_attrs: Optional attributes for the parent table tag.
 
     Returns:
@@ -25,36 +34,37 @@ def nested_html_table(
     # input: list, each item may be scalar or list
     # output: a parent table with one child table per parent item that is list, and one cell per parent item that is scalar
     # purpose: create the appearance of one table, where cell widths are independent between rows
-    # attributes in any leading <tdX> inside a list are injected into to the preceeding <td> tag
+    # cells given as (attributes, contents) tuples get the attributes added to their <td> tag
     html = []
-    html.append(f'<table border="0" cellspacing="0" cellpadding="0"{table_attrs or ""}>')
+    append = html.append  # avoid the attribute lookup in the loops below
+    append(f'<table border="0" cellspacing="0" cellpadding="0"{table_attrs or ""}>')
 
     num_rows = 0
     for row in rows:
         if isinstance(row, list):
             if len(row) > 0 and any(row):
-                html.append(" <tr><td>")
+                append(" <tr><td>")
                 # fmt: off
-                html.append('  <table border="0" cellspacing="0" cellpadding="3" cellborder="1"><tr>')
+                append('  <table border="0" cellspacing="0" cellpadding="3" cellborder="1"><tr>')
                 # fmt: on
                 for cell in row:
-                    if cell is not None:
-                        # Inject attributes to the preceeding <td> tag where needed
-                        # fmt: off
-                        html.append(f'   <td balign="left">{cell}</td>'.replace("><tdX", ""))
-                        # fmt: on
-                html.append("  </tr></table>")
-                html.append(" </td></tr>")
+                    if isinstance(cell, tuple):
+                        attrs, contents = cell
+                        append(f'   <td balign="left"{attrs}>{contents}</td>')
+                    elif cell is not None:
+                        append(f'   <td balign="left">{cell}</td>')
+                append("  </tr></table>")
+                append(" </td></tr>")
                 num_rows = num_rows + 1
         elif row is not None:
-            html.append(" <tr><td>")
-            html.append(f"  {row}")
-            html.append(" </td></tr>")
+            append(" <tr><td>")
+            append(f"  {row}")
+            append(" </td></tr>")
             num_rows = num_rows + 1
     if num_rows == 0:  # empty table
         # generate empty cell to avoid GraphViz errors
-        html.append("<tr><td></td></tr>")
-    html.append("</table>")
+        append("<tr><td></td></tr>")
+    append("</table>")
     return html
 
 
@@ -64,52 +74,46 @@ def html_bgcolor_attr(color: Color) -> str:
 
 
 def html_bgcolor(color: Color, _extra_attr: str = "") -> str:
-    """Return <td> attributes prefix for bgcolor or '' if no color."""
-    return f"<tdX{html_bgcolor_attr(color)}{_extra_attr}>" if color else ""
+    """Return <td> attributes for bgcolor or '' if no color."""
+    return f"{html_bgcolor_attr(color)}{_extra_attr}" if color else ""
 
 
-def html_colorbar(color: Color) -> str:
-    """Return <tdX> attributes prefix for bgcolor and minimum width or None if no color."""
-    return html_bgcolor(color, ' width="4"') if color else None
+def html_colorbar(color: Color) -> tuple[str, str] | None:
+    """Return an empty cell with bgcolor and minimum width or None if no color."""
+    return (html_bgcolor(color, ' width="4"'), "") if color else None
 
 
-def html_image(image: Image | None) -> str | None:
+def html_image(image: Image | None) -> tuple[str, str] | None:
     """Generate HTML for an image in Graphviz format.
 
     Args:
         image: Image configuration object.
 
     Returns:
-        HTML string with <tdX> tag and image, or None if no image provided.
+        Tuple of <td> attributes and image HTML, or None if no image provided.
     """
     if not image:
         return None
-    # The leading attributes belong to the preceeding tag. See where used below.
-    html = f'{html_size_attr(image)}><img scale="{image.scale}" src="{image.src}"/>'
+    attrs = f"""{' sides="TLR"' if image.caption else ""}{html_bgcolor_attr(image.bgcolor)}"""
+    img = f'<img scale="{image.scale}" src="{image.src}"/>'
     if image.fixedsize:
-        # Close the preceeding tag and enclose the image cell in a table without
-        # borders to avoid narrow borders when the fixed width < the node width.
-        html = f""">
-    <table border="0" cellspacing="0" cellborder="0"><tr>
-     <td{html}</td>
-    </tr></table>
-   """
-    return (
-        f"""<tdX{' sides="TLR"' if image.caption else ""}{html_bgcolor_attr(image.bgcolor)}{html}"""
-    )
+        # Enclose the image cell in a table without borders
+        # to avoid narrow borders when the fixed width < the node width.
+        return (attrs, _FIXED_WRAP.format(size=html_size_attr(image), img=img))
+    return (f"{attrs}{html_size_attr(image)}", img)
 
 
-def html_caption(image: Image | None) -> str | None:
+def html_caption(image: Image | None) -> tuple[str, str] | None:
     """Generate HTML for an image caption in Graphviz format.
 
     Args:
         image: Image configuration object containing caption text.
 
     Returns:
-        HTML string with caption <tdX> tag, or None if no caption.
+        Tuple of <td> attributes and caption HTML, or None if no caption.
     """
     return (
-        f'<tdX sides="BLR"{html_bgcolor_attr(image.bgcolor)}>{html_line_breaks(image.caption)}'
+        (f' sides="BLR"{html_bgcolor_attr(image.bgcolor)}', html_line_breaks(image.caption))
         if image and image.caption
         else None
     )
@@ -146,4 +150,6 @@ def html_line_breaks(inp: Any) -> Any:
         String with newlines replaced by <br /> tags and links removed,
         or unchanged if not a string.
     """
-    return remove_links(inp).replace("\n", "<br />") if isinstance(inp, str) else inp
+    if type(inp) is not str:  # exact type check, YAML never produces str subclasses
+        return inp
+    return remove_links(inp).replace("\n", "<br />")
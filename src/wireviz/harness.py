@@ -86,10 +86,10 @@ class Harness:
         self._bom = []  # Internal Cache for generated bom
         self.additional_bom_items = []
 
-    def add_connector(self, name: str, *args, **kwargs) -> None:
+    def add_connector(self, name: str, **kwargs) -> None:
         check_old(f"Connector '{name}'", OLD_CONNECTOR_ATTR, kwargs)
         try:
-            self.connectors[name] = Connector(name, *args, **kwargs)
+            self.connectors[name] = Connector.from_mapping({"name": name, **kwargs})
         except Exception as e:
             # Add context about which connector failed
             error_msg = str(e)
@@ -99,9 +99,9 @@ class Harness:
                 new_msg = f"Error in connector '{name}'"
             raise type(e)(new_msg) from e
 
-    def add_cable(self, name: str, *args, **kwargs) -> None:
+    def add_cable(self, name: str, **kwargs) -> None:
         try:
-            self.cables[name] = Cable(name, *args, **kwargs)
+            self.cables[name] = Cable.from_mapping({"name": name, **kwargs})
         except Exception as e:
             # Add context about which cable failed
             error_msg = str(e)
@@ -214,7 +214,7 @@ class Harness:
 
             html = []
             # fmt: off
-            rows = [[f'{html_bgcolor(connector.bgcolor_title)}{remove_links(connector.name)}'
+            rows = [[(html_bgcolor(connector.bgcolor_title), remove_links(connector.name))
                         if connector.show_name else None],
                     [pn_info_string(HEADER_PN, None, remove_links(connector.pn)),
                      html_line_breaks(pn_info_string(HEADER_MPN, connector.manufacturer, connector.mpn)),
@@ -240,9 +240,7 @@ class Harness:
                 for pinindex, (pinname, pinlabel, pincolor) in enumerate(
                     zip_longest(connector.pins, connector.pinlabels, connector.pincolors)
                 ):
-                    if connector.hide_disconnected_pins and not connector.visible_pins.get(
-                        pinname, False
-                    ):
+                    if connector.hide_disconnected_pins and pinname not in connector.visible_pins:
                         continue
 
                     pinhtml.append("   <tr>")
@@ -318,7 +316,7 @@ class Harness:
                     awg_fmt = f" ({mm2_equiv(cable.gauge)} mm\u00b2)"
 
             # fmt: off
-            rows = [[f'{html_bgcolor(cable.bgcolor_title)}{remove_links(cable.name)}'
+            rows = [[(html_bgcolor(cable.bgcolor_title), remove_links(cable.name))
                         if cable.show_name else None],
                     [pn_info_string(HEADER_PN, None,
                         remove_links(cable.pn)) if not isinstance(cable.pn, list) else None,
@@ -426,9 +424,9 @@ class Harness:
                 wirehtml.append("    <td>Shield</td>")
                 wirehtml.append("    <td><!-- s_out --></td>")
                 wirehtml.append("   </tr>")
-                if isinstance(cable.shield, str):
+                if cable.shield_color:
                     # shield is shown with specified color and black borders
-                    shield_color_hex = colors.get_color_hex(cable.shield)[0]
+                    shield_color_hex = colors.get_color_hex(cable.shield_color)[0]
                     attributes = f'height="6" bgcolor="{shield_color_hex}" border="2" sides="tb"'
                 else:
                     # shield is shown as a thin black wire
@@ -460,7 +458,7 @@ class Harness:
                         "edge",
                         color=(
                             ":".join(["#000000", shield_color_hex, "#000000"])
-                            if isinstance(cable.shield, str)
+                            if cable.shield_color
                             else "#000000"
                         ),
                     )
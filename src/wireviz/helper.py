@@ -1,9 +1,18 @@
 import ast
 import operator
+import os
 import re
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from itertools import chain
 from pathlib import Path
 from typing import Any, TextIO
 
+try:
+    from PIL import Image
+except ImportError:  # only needed by aspect_ratio(), which then assumes 1:1
+    Image = None
+
 awg_equiv_table = {
     "0.09": "28",
     "0.14": "26",
@@ -26,6 +35,27 @@ awg_equiv_table = {
 mm2_equiv_table = {v: k for k, v in awg_equiv_table.items()}
 
 
+def _with_numeric_keys(table: dict[str, str]) -> dict[str | int | float, str]:
+    """Return a copy of table also keyed by the int/float value of each key."""
+    lookup: dict[str | int | float, str] = dict(table)
+    for key, value in table.items():
+        number = float(key)
+        lookup[int(number) if number.is_integer() else number] = value
+    return lookup
+
+
+# Lookups accepting gauges as parsed from YAML (str, int or float) without str() per call
+_awg_lookup = _with_numeric_keys(awg_equiv_table)
+_mm2_lookup = _with_numeric_keys(mm2_equiv_table)
+
+# Patterns used once per cell/connection, compiled once at import
+_LINK_RE = re.compile(r"<[aA] [^>]*>([^<]*)</[aA]>")
+_WS_RE = re.compile(r"\s+")
+# regex by @shiraneyo
+_ARROW_CHARS = frozenset("<>-=")
+_ARROW_RE = re.compile(r"^\s*(?P<leftHead><?)(?P<body>-+|=+)(?P<rightHead>>?)\s*$")
+
+
 def awg_equiv(mm2: str | int | float) -> str:
     """Convert mm² gauge to AWG equivalent.
 
@@ -35,7 +65,7 @@ def awg_equiv(mm2: str | int | float) -> str:
     Returns:
         AWG equivalent as a string, or "Unknown" if not in table.
     """
-    return awg_equiv_table.get(str(mm2), "Unknown")
+    return _awg_lookup.get(mm2, "Unknown")
 
 
 def mm2_equiv(awg: str | int) -> str:
@@ -47,7 +77,7 @@ def mm2_equiv(awg: str | int) -> str:
     Returns:
         mm² equivalent as a string, or "Unknown" if not in table.
     """
-    return mm2_equiv_table.get(str(awg), "Unknown")
+    return _mm2_lookup.get(awg, "Unknown")
 
 
 def expand(yaml_data: Any | list[Any]) -> list[int | str]:
@@ -77,27 +107,29 @@ def expand(yaml_data: Any | list[Any]) -> list[int | str]:
     if not isinstance(yaml_data, list):
         yaml_data = [yaml_data]
     for e in yaml_data:
+        if type(e) is int and e >= 0:
+            output.append(e)  # single int, already native
+            continue
         e = str(e)
-        if "-" in e:
-            a, b = e.split("-", 1)
+        a, sep, b = e.partition("-")
+        if sep:
             try:
+                if not (a and b):
+                    raise ValueError  # leading/trailing '-', e.g. a negative number
                 a = int(a)
                 b = int(b)
-                if a < b:
-                    for x in range(a, b + 1):
-                        output.append(x)  # ascending range
-                elif a > b:
-                    for x in range(a, b - 1, -1):
-                        output.append(x)  # descending range
-                else:  # a == b
-                    output.append(a)  # range of length 1
-            except Exception:
+            except ValueError:
                 # '-' was not a delimiter between two ints, pass e through unchanged
                 output.append(e)
+                continue
+            if a <= b:
+                output.extend(range(a, b + 1))  # ascending range, or range of length 1
+            else:
+                output.extend(range(a, b - 1, -1))  # descending range
         else:
             try:
                 x = int(e)  # single int
-            except Exception:
+            except ValueError:
                 x = e  # string
             output.append(x)
     return output
@@ -162,13 +194,19 @@ def tuplelist2tsv(inp: list[list[Any]], header: list[str] | None = None) -> str:
     Returns:
         TSV formatted string with one row per line.
     """
-    output = ""
-    if header is not None:
-        inp.insert(0, header)
-    inp = flatten2d(inp)
-    for row in inp:
-        output = output + "\t".join(str(remove_links(item)) for item in row) + "\n"
-    return output
+    rows = []
+    for row in chain((header,), inp) if header is not None else inp:
+        # same per-item conversion as flatten2d(), without building the 2D list first
+        rows.append(
+            "\t".join(
+                [
+                    remove_links(str(item) if not isinstance(item, list) else ", ".join(item))
+                    for item in row
+                ]
+            )
+        )
+        rows.append("\n")
+    return "".join(rows)
 
 
 def remove_links(inp: Any) -> Any:
@@ -180,7 +218,9 @@ def remove_links(inp: Any) -> Any:
     Returns:
         Input with <a> tags removed (text content preserved), or unchanged if not a string.
     """
-    return re.sub(r"<[aA] [^>]*>([^<]*)</[aA]>", r"\1", inp) if isinstance(inp, str) else inp
+    if not isinstance(inp, str) or "<" not in inp:
+        return inp  # nothing that could be a link
+    return _LINK_RE.sub(r"\1", inp)
 
 
 def clean_whitespace(inp: Any) -> Any:
@@ -195,7 +235,10 @@ def clean_whitespace(inp: Any) -> Any:
     Returns:
         String with normalized whitespace, or unchanged if not a string.
     """
-    return " ".join(inp.split()).replace(" ,", ",") if isinstance(inp, str) else inp
+    if not isinstance(inp, str):
+        return inp
+    s = _WS_RE.sub(" ", inp).strip()
+    return s.replace(" ,", ",") if "," in s else s
 
 
 def open_file_read(filename: str | Path) -> TextIO:
@@ -216,7 +259,9 @@ def open_file_append(filename: str | Path) -> TextIO:
 
 def file_read_text(filename: str) -> str:
     """Read utf-8 encoded text file, close it, and return the text"""
-    return Path(filename).read_text(encoding="utf-8")
+    text = Path(filename).read_bytes().decode("utf-8")
+    # bypassing the text layer skips its newline translation, so do that here when needed
+    return text.replace("\r\n", "\n").replace("\r", "\n") if "\r" in text else text
 
 
 def file_write_text(filename: str, text: str) -> int:
@@ -233,8 +278,33 @@ def is_arrow(inp: Any) -> bool:
       <-, --, ->, <->
       <==, ==, ==>, <=>
     """
-    # regex by @shiraneyo
-    return bool(re.match(r"^\s*(?P<leftHead><?)(?P<body>-+|=+)(?P<rightHead>>?)\s*$", inp))
+    s = inp.strip()
+    if not s or s[0] not in "<-=" or not _ARROW_CHARS.issuperset(s):
+        return False  # cheap rejection of designators and other non-arrows
+    return bool(_ARROW_RE.match(inp))
+
+
+def cache_per_file_version(maxsize: int) -> Callable:
+    """Decorator caching func(path) until the file's modification time or size changes.
+
+    The wrapper raises OSError if the file cannot be stat'ed, and exposes
+    cache_clear() like functools.lru_cache.
+    """
+
+    def decorator(func: Callable[[str], Any]) -> Callable[[str | Path], Any]:
+        @lru_cache(maxsize=maxsize)
+        def cached(path: str, mtime_ns: int, size: int) -> Any:
+            return func(path)  # mtime_ns and size only serve as cache key
+
+        @wraps(func)
+        def wrapper(path: str | Path) -> Any:
+            st = os.stat(path)
+            return cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
 
 
 def aspect_ratio(image_src: str | Path) -> float:
@@ -245,15 +315,27 @@ def aspect_ratio(image_src: str | Path) -> float:
 
     Returns:
         Aspect ratio as width/height, or 1.0 if unable to read the image.
+        Results are cached per file version, so images reused across
+        connectors and cables are only opened once.
     """
     try:
-        from PIL import Image
+        return _read_aspect_ratio(image_src)
+    except Exception as error:
+        print(f"aspect_ratio(): {type(error).__name__}: {error}")
+        return 1  # Assume 1:1 when unable to read actual image size
+
 
+@cache_per_file_version(maxsize=512)
+def _read_aspect_ratio(image_src: str) -> float:
+    if Image is None:
+        print("aspect_ratio(): ModuleNotFoundError: No module named 'PIL'")
+        return 1  # Assume 1:1 when unable to read actual image size
+    try:
         with Image.open(image_src) as image:
             if image.width > 0 and image.height > 0:
                 return image.width / image.height
             print(f"aspect_ratio(): Invalid image size {image.width} x {image.height}")
-    # ModuleNotFoundError and FileNotFoundError are the most expected, but all are handled equally.
+    # FileNotFoundError is the most expected, but all are handled equally.
     except Exception as error:
         print(f"aspect_ratio(): {type(error).__name__}: {error}")
     return 1  # Assume 1:1 when unable to read actual image size
@@ -283,17 +365,17 @@ def smart_file_resolve(filename: str, possible_paths: str | Path | list[str | Pa
             return filename
         else:
             raise Exception(f"{filename} does not exist.")
-    else:  # search all possible paths in decreasing order of precedence
-        possible_paths = [Path(path).resolve() for path in possible_paths if path is not None]
-        for possible_path in possible_paths:
-            resolved_path = (possible_path / filename).resolve()
-            if resolved_path.exists():
-                return resolved_path
-        else:
-            raise Exception(
-                f"{filename} was not found in any of the following locations: \n"
-                + "\n".join([str(x) for x in possible_paths])
-            )
+    # search all possible paths in decreasing order of precedence, resolving only the match
+    possible_paths = [path for path in possible_paths if path is not None]
+    name = os.fspath(filename)
+    for possible_path in possible_paths:
+        candidate = os.path.join(possible_path, name)  # plain str join and stat
+        if os.path.exists(candidate):
+            return Path(candidate).resolve()
+    raise Exception(
+        f"{filename} was not found in any of the following locations: \n"
+        + "\n".join([str(Path(x).resolve()) for x in possible_paths])
+    )
 
 
 def evaluate_expression(expr: str | int | float, context: dict[str, Any]) -> float:
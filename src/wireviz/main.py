@@ -1,8 +1,12 @@
 import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 
 import typer
+import yaml
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -29,6 +33,140 @@ format_codes = {
 }
 
 
+@lru_cache(maxsize=64)
+def _resolve_formats(format_string: str) -> tuple[str, ...]:
+    """Translate format codes into a sorted tuple of unique output formats."""
+    if not format_codes.keys() >= set(format_string):
+        unknown = next(code for code in format_string if code not in format_codes)
+        raise Exception(f"Unknown output format: {unknown}")
+    return tuple(sorted({format_codes[code] for code in format_string}))
+
+
+def _load_input(yaml_input: str, f: Path) -> dict:
+    """Parse the (prepended) input once here, so that wv.parse() receives a dict."""
+    try:
+        return wv.load_yaml(yaml_input)
+    except yaml.YAMLError as e:
+        raise type(e)(f"YAML parsing error in file '{f}': {e}") from e
+
+
+def _process_file(
+    f: Path,
+    prepend_input: str,
+    prepend: list[str] | None,
+    output_formats: tuple[str, ...],
+    output_dir: Path,
+    output_name: str,
+    on_parsed: Callable[[], None] | None = None,
+) -> None:
+    """Read, parse and render one input file. Runs in a worker process when parallel."""
+    yaml_input = prepend_input + file_read_text(f)
+    # Only add non-empty prepend paths
+    image_paths = {f.parent, *(Path(p).parent for p in prepend or () if p)}
+
+    yaml_data = _load_input(yaml_input, f)
+    if on_parsed:
+        on_parsed()
+
+    wv.parse(
+        yaml_data,
+        output_formats=output_formats,
+        output_dir=output_dir,
+        output_name=output_name,
+        image_paths=list(image_paths),
+    )
+
+
+def _print_generated(output_dir: Path, output_name: str, output_formats: tuple[str, ...]) -> None:
+    """Show individual output files"""
+    console.print("[dim]Generated files:[/dim]")
+    output_dir = Path(output_dir)
+    for fmt in output_formats:
+        if fmt == "tsv":
+            output_path = output_dir / f"{output_name}.bom.{fmt}"
+        else:
+            output_path = output_dir / f"{output_name}.{fmt}"
+        console.print(f"  [dim]→[/dim] {output_path}")
+
+
+def _output_targets(
+    filepaths: list[str], output_dir: Path | None, output_name: str | None
+) -> list[tuple[Path, Path, str]]:
+    """Check that all input files exist and determine (file, output dir, output name) for each."""
+    targets = []
+    for fi in filepaths:
+        f = Path(fi)
+        if not f.exists():
+            raise Exception(f"File does not exist:\n{f}")
+        # file_out = file.with_suffix("") if not output_file else output_file
+        _output_dir = f.parent if not output_dir else output_dir
+        _output_name = f.stem if not output_name else output_name
+        targets.append((f, _output_dir, _output_name))
+    return targets
+
+
+def _run_file(
+    f: Path,
+    output_dir: Path,
+    output_name: str,
+    output_formats: tuple[str, ...],
+    quiet: bool | None,
+    run: Callable[[Callable[[], None] | None], None],
+) -> None:
+    """Report one input file around run(), which processes it or waits for its worker."""
+    if not quiet:
+        console.print(f"\n[bold]Processing:[/bold] [green]{f}[/green]")
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        ) as progress:
+            task1 = progress.add_task("[cyan]Parsing input file...", total=None)
+            run(
+                partial(progress.update, task1, description="[cyan]Building harness connections...")
+            )
+            progress.update(task1, description="[green]✓ Complete")
+
+        _print_generated(output_dir, output_name, output_formats)
+    else:
+        output_formats_str = (
+            f"[{'|'.join(output_formats)}]" if len(output_formats) > 1 else output_formats[0]
+        )
+        print("Input file:  ", f)
+        print("Output file: ", f"{Path(output_dir / output_name)}.{output_formats_str}")
+        run(None)
+
+
+def _process_parallel(
+    targets: list[tuple[Path, Path, str]],
+    workers: int,
+    prepend_input: str,
+    prepend: list[str] | None,
+    output_formats: tuple[str, ...],
+    quiet: bool | None,
+) -> None:
+    """Process independent input files in a process pool, reporting them as they finish."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _process_file, f, prepend_input, prepend, output_formats, _output_dir, _output_name
+            ): (f, _output_dir, _output_name)
+            for f, _output_dir, _output_name in targets
+        }
+        for future in as_completed(futures):
+            f, _output_dir, _output_name = futures[future]
+            # re-raise any error from the worker; progress steps are not reported across processes
+            _run_file(
+                f,
+                _output_dir,
+                _output_name,
+                output_formats,
+                quiet,
+                lambda _on_parsed, future=future: future.result(),
+            )
+
+
 def wireviz(
     file: list[str],
     output_name: str | None = None,
@@ -37,9 +175,13 @@ def wireviz(
     output_dir: Path | None = ".\\",
     version: bool | None = False,
     quiet: bool | None = False,
+    jobs: int | None = None,
 ) -> None:
     """
     Parses the provided FILE and generates the specified outputs.
+
+    With several input files, they are processed in parallel using up to
+    JOBS worker processes (default: one per CPU core, --jobs 1 to disable).
     """
     if not quiet:
         console.print(f"\n[bold cyan]{APP_NAME}[/bold cyan] [cyan]{__version__}[/cyan]")
@@ -58,20 +200,11 @@ def wireviz(
         filepaths = list(file)
 
     # determine output formats
-    output_formats = []
-    for code in format:
-        if code in format_codes:
-            output_formats.append(format_codes[code])
-        else:
-            raise Exception(f"Unknown output format: {code}")
-    output_formats = tuple(sorted(set(output_formats)))
-    output_formats_str = (
-        f"[{'|'.join(output_formats)}]" if len(output_formats) > 1 else output_formats[0]
-    )
+    output_formats = _resolve_formats(format)
 
     # check prepend file
+    prepend_parts = []
     if prepend and len(prepend) > 0:
-        prepend_input = ""
         for prepend_file in prepend:
             prepend_file = Path(prepend_file)
             if not prepend_file.exists():
@@ -81,80 +214,34 @@ def wireviz(
             else:
                 print("Prepend file:", prepend_file)
 
-            prepend_input += file_read_text(prepend_file) + "\n"
-    else:
-        prepend_input = ""
+            prepend_parts.append(file_read_text(prepend_file))
+            prepend_parts.append("\n")
+    prepend_input = "".join(prepend_parts)
 
     # run WireVIz on each input file
-    for fi in filepaths:
-        f = Path(fi)
-        if not f.exists():
-            raise Exception(f"File does not exist:\n{f}")
-
-        # file_out = file.with_suffix("") if not output_file else output_file
-        _output_dir = f.parent if not output_dir else output_dir
-        _output_name = f.stem if not output_name else output_name
-
-        if not quiet:
-            console.print(f"\n[bold]Processing:[/bold] [green]{f}[/green]")
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True,
-            ) as progress:
-                task1 = progress.add_task("[cyan]Parsing input file...", total=None)
-                yaml_input = file_read_text(f)
-                file_dir = f.parent
-
-                yaml_input = prepend_input + yaml_input
-                image_paths = {file_dir}
-                if prepend:
-                    for p in prepend:
-                        if p:  # Only add non-empty prepend paths
-                            image_paths.add(Path(p).parent)
-
-                progress.update(task1, description="[cyan]Building harness connections...")
-
-                wv.parse(
-                    yaml_input,
-                    output_formats=output_formats,
-                    output_dir=_output_dir,
-                    output_name=_output_name,
-                    image_paths=list(image_paths),
-                )
-
-                progress.update(task1, description="[green]✓ Complete")
-
-            # Show individual output files
-            console.print("[dim]Generated files:[/dim]")
-            for fmt in output_formats:
-                if fmt == "tsv":
-                    output_path = Path(_output_dir) / f"{_output_name}.bom.{fmt}"
-                else:
-                    output_path = Path(_output_dir) / f"{_output_name}.{fmt}"
-                console.print(f"  [dim]→[/dim] {output_path}")
-        else:
-            print("Input file:  ", f)
-            print("Output file: ", f"{Path(_output_dir / _output_name)}.{output_formats_str}")
-
-            yaml_input = file_read_text(f)
-            file_dir = f.parent
-
-            yaml_input = prepend_input + yaml_input
-            image_paths = {file_dir}
-            if prepend:
-                for p in prepend:
-                    if p:  # Only add non-empty prepend paths
-                        image_paths.add(Path(p).parent)
-
-            wv.parse(
-                yaml_input,
-                output_formats=output_formats,
-                output_dir=_output_dir,
-                output_name=_output_name,
-                image_paths=list(image_paths),
-            )
+    targets = _output_targets(filepaths, output_dir, output_name)
+    workers = jobs if jobs else min(len(targets), os.cpu_count() or 1)
+    # never let workers write the same output files concurrently
+    output_paths = {
+        Path(_output_dir).resolve() / _output_name for _, _output_dir, _output_name in targets
+    }
+    if output_name or len(output_paths) < len(targets):
+        workers = 1
+    if workers > 1 and len(targets) > 1:
+        _process_parallel(targets, workers, prepend_input, prepend, output_formats, quiet)
+        targets = []  # all done
+
+    for f, _output_dir, _output_name in targets:
+        _run_file(
+            f,
+            _output_dir,
+            _output_name,
+            output_formats,
+            quiet,
+            partial(
+                _process_file, f, prepend_input, prepend, output_formats, _output_dir, _output_name
+            ),
+        )
 
     if quiet:
         print()
@@ -1,15 +1,38 @@
-import base64
+import binascii
+import mmap
 import re
+from functools import lru_cache
 from pathlib import Path
 
+from wireviz.helper import cache_per_file_version
+
 mime_subtype_replacements = {"jpg": "jpeg", "tif": "tiff"}
 
+_B64_CHUNK = 57 * 1024  # bytes read per Base64 encoding step
+_MMAP_THRESHOLD = 4 * 1024 * 1024  # SVG files larger than this are scanned memory-mapped
+
+
+@cache_per_file_version(maxsize=128)
+def file_base64(file: str | Path) -> str:
+    """Return Base64-encoded contents of file, cached until the file changes."""
+    # Encode in chunks (a multiple of 3 bytes, so no padding in between) instead of
+    # holding the raw file, its encoding and the decoded copy in memory at once
+    buf = bytearray()
+    with open(file, "rb") as f:
+        while chunk := f.read(_B64_CHUNK):
+            buf += binascii.b2a_base64(chunk, newline=False)
+    return buf.decode("ascii")
+
+
+def clear_svg_image_cache() -> None:
+    """Drop all cached Base64 encodings, e.g. between runs in a long-lived process."""
+    file_base64.cache_clear()
+
 
-# TODO: Share cache and code between data_URI_base64() and embed_svg_images()
 def data_URI_base64(file: str | Path, media: str = "image") -> str:
     """Return Base64-encoded data URI of input file."""
     file = Path(file)
-    b64 = base64.b64encode(file.read_bytes()).decode("utf-8")
+    b64 = file_base64(file)
     uri = f"data:{media}/{get_mime_subtype(file)};base64, {b64}"
     # print(f"data_URI_base64('{file}', '{media}') -> {len(uri)}-character URI")
     if len(uri) > 65535:
@@ -17,6 +40,17 @@ def data_URI_base64(file: str | Path, media: str = "image") -> str:
     return uri
 
 
+def _image_tag(pre: str, url: str, post: str) -> str:
+    return f'<image{pre} xlink:href="{url}"{post}>'
+
+
+_IMAGE_TAG_RE = re.compile(
+    _image_tag(r"(?P<PRE> [^>]*?)?", r'(?P<URL>[^"]*?)', r"(?P<POST> [^>]*?)?"),
+    re.IGNORECASE,
+)
+_IMAGE_TAG_RE_BYTES = re.compile(_IMAGE_TAG_RE.pattern.encode("utf-8"), re.IGNORECASE)
+
+
 def embed_svg_images(svg_in: str, base_path: str | Path | None = None) -> str:
     """Embed external images in SVG as Base64 data URIs.
 
@@ -29,32 +63,53 @@ def embed_svg_images(svg_in: str, base_path: str | Path | None = None) -> str:
     Returns:
         SVG content with images embedded as data URIs.
     """
+    if "<image" not in svg_in:
+        return svg_in  # nothing to embed; Graphviz writes lowercase tags, no regex pass needed
     if base_path is None:
         base_path = Path.cwd()
-    images_b64 = {}  # cache of base64-encoded images
+    images_uri = {}  # data URI per image URL in this SVG; file_base64() caches across SVGs
 
-    def image_tag(pre: str, url: str, post: str) -> str:
-        return f'<image{pre} xlink:href="{url}"{post}>'
-
-    def replace(match: re.Match) -> str:
+    parts = []
+    pos = 0
+    for match in _IMAGE_TAG_RE.finditer(svg_in):
         imgurl = match["URL"]
-        if imgurl not in images_b64:  # only encode/cache every unique URL once
-            imgurl_abs = (Path(base_path) / imgurl).resolve()
-            image = imgurl_abs.read_bytes()
-            images_b64[imgurl] = base64.b64encode(image).decode("utf-8")
-        return image_tag(
-            match["PRE"] or "",
-            f"data:image/{get_mime_subtype(imgurl)};base64, {images_b64[imgurl]}",
-            match["POST"] or "",
-        )
-
-    pattern = re.compile(
-        image_tag(r"(?P<PRE> [^>]*?)?", r'(?P<URL>[^"]*?)', r"(?P<POST> [^>]*?)?"),
-        re.IGNORECASE,
-    )
-    return pattern.sub(replace, svg_in)
-
-
+        if imgurl not in images_uri:  # only encode/cache every unique URL once
+            b64 = file_base64((Path(base_path) / imgurl).resolve())
+            images_uri[imgurl] = f"data:image/{get_mime_subtype(imgurl)};base64, {b64}"
+        parts.append(svg_in[pos : match.start()])
+        parts.append(_image_tag(match["PRE"] or "", images_uri[imgurl], match["POST"] or ""))
+        pos = match.end()
+    parts.append(svg_in[pos:])
+    return "".join(parts)
+
+
+def _embed_svg_images_bytes(svg_in: bytes | mmap.mmap, base_path: Path) -> bytearray:
+    """Same as embed_svg_images(), but on UTF-8 encoded SVG content."""
+    images_uri = {}  # data URI per image URL in this SVG; file_base64() caches across SVGs
+
+    out = bytearray()
+    pos = 0
+    for match in _IMAGE_TAG_RE_BYTES.finditer(svg_in):
+        imgurl = match["URL"]
+        if imgurl not in images_uri:  # only encode/cache every unique URL once
+            imgpath = imgurl.decode("utf-8")
+            b64 = file_base64((base_path / imgpath).resolve())
+            images_uri[imgurl] = f"data:image/{get_mime_subtype(imgpath)};base64, {b64}".encode()
+        # write the pieces of _image_tag() straight into the output buffer
+        out += svg_in[pos : match.start()]
+        out += b"<image"
+        out += match["PRE"] or b""
+        out += b' xlink:href="'
+        out += images_uri[imgurl]
+        out += b'"'
+        out += match["POST"] or b""
+        out += b">"
+        pos = match.end()
+    out += svg_in[pos:]
+    return out
+
+
+@lru_cache(maxsize=256)
 def get_mime_subtype(filename: str | Path) -> str:
     """Get MIME subtype from filename extension.
 
@@ -78,9 +133,15 @@ def embed_svg_images_file(filename_in: str | Path, overwrite: bool = True) -> No
         overwrite: If True, replaces the original file. If False, creates a .b64.svg file.
     """
     filename_in = Path(filename_in).resolve()
-    filename_out = filename_in.with_suffix(".b64.svg")
+    # the input is read completely before writing, so it can be overwritten directly
+    filename_out = filename_in if overwrite else filename_in.with_suffix(".b64.svg")
+    if filename_in.stat().st_size > _MMAP_THRESHOLD:
+        # scan the raw UTF-8 bytes without first decoding a copy of the whole file
+        with open(filename_in, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            svg_out = _embed_svg_images_bytes(mm, filename_in.parent)
+        filename_out.write_bytes(svg_out)
+        return
     filename_out.write_text(  # TODO?: Verify xml encoding="utf-8" in SVG?
-        embed_svg_images(filename_in.read_text(), filename_in.parent)
-    )  # TODO: Use encoding="utf-8" in both read_text() and write_text()
-    if overwrite:
-        filename_out.replace(filename_in)
+        embed_svg_images(filename_in.read_text(encoding="utf-8"), filename_in.parent),
+        encoding="utf-8",
+    )
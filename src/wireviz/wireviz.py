@@ -22,6 +22,14 @@ from wireviz.helper import (
 
 from . import APP_NAME
 
+# libyaml-based loader when PyYAML was built with it, pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(yaml_str: str) -> Any:
+    """Parse a YAML string with the fastest available safe loader."""
+    return yaml.load(yaml_str, Loader=_YamlLoader)
+
 
 def _add_context_to_error(e: Exception, context: str) -> Exception:
     """Add contextual information to an exception message.
@@ -497,7 +505,7 @@ def _expand_connection_includes(
             # Load the included YAML file and extract its connections section.
             included_yaml_str = file_read_text(include_path)
             try:
-                included_data = yaml.safe_load(included_yaml_str)
+                included_data = load_yaml(included_yaml_str)
             except yaml.YAMLError as e:
                 raise ValueError(
                     f"YAML parsing error in included file '{include_path}': {e}"
@@ -552,7 +560,7 @@ def _get_yaml_data_and_path(inp: str | Path | dict) -> tuple[dict, Path]:
             yaml_str = inp
             yaml_path = None
         try:
-            yaml_data = yaml.safe_load(yaml_str)
+            yaml_data = load_yaml(yaml_str)
         except yaml.YAMLError as e:
             # Add file context if available
             if yaml_path: